@@ -6,22 +6,39 @@ and provides intelligent filtering to show only the best quality results.
 """
 
 import os
+import re
 import csv
-import json
+import gzip
+import mmap
+import bisect
+import heapq
 import time
+import sqlite3
+import atexit
+import queue
 import logging
+import logging.handlers
 import threading
+import traceback
+import unicodedata
 from datetime import datetime
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from io import StringIO
+from typing import Dict, List, Optional, TextIO, Tuple
+from io import StringIO, TextIOWrapper
+from operator import attrgetter
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, send_file, flash
+from flask import Flask, Response, render_template, request, jsonify, redirect, url_for, send_file, flash
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
 import requests
-import difflib
+from requests.adapters import HTTPAdapter
+import orjson
+import functools
 import concurrent.futures
 import pykakasi
+from rapidfuzz import fuzz
 import random
 from urllib.parse import quote, unquote
 
@@ -39,6 +56,7 @@ DEFAULT_CONFIG = {
     'SLSKD_URL_BASE': os.getenv('SLSKD_URL_BASE', '/'),
     'SEARCH_TIMEOUT': int(os.getenv('SEARCH_TIMEOUT', '15')),
     'SEARCH_DELAY': int(os.getenv('SEARCH_DELAY', '1')),  # Reduced from 2 to 1 for faster searches
+    'SEARCH_CONCURRENCY': int(os.getenv('SEARCH_CONCURRENCY', '4')),  # Parallel artist searches against Slskd
     'DATA_DIR': os.getenv('DATA_DIR', '/app/data'),
     # Smart Quality Settings
     'MIN_BITRATE': 192,
@@ -46,15 +64,25 @@ DEFAULT_CONFIG = {
     'MIN_SPEED_KBS': 50,
     'TOP_RESULTS_COUNT': 50,  # Increased to allow client-side filtering
     'MAX_FILE_SIZE_MB': 30,  # Maximum file size in MB
+    'ARTISTS_PER_PAGE': 50,  # Artist groups rendered per dashboard page
+    'SEARCH_CACHE_TTL': int(os.getenv('SEARCH_CACHE_TTL', '3600')),  # Seconds to reuse raw Slskd results, 0 disables
+    'WATCHLIST_INTERVAL': int(os.getenv('WATCHLIST_INTERVAL', '300')),  # Seconds between watchlist checks
 }
 
+def atomic_write(path: Path, payload: bytes):
+    """Replace a file's contents so readers never see a partially written file"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
 # Load configuration from file or environment
 def load_config():
     """Load configuration from file or use defaults"""
     if CONFIG_FILE.exists():
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                saved_config = json.load(f)
+            with open(CONFIG_FILE, 'rb') as f:
+                saved_config = orjson.loads(f.read())
                 # Merge with defaults
                 config = DEFAULT_CONFIG.copy()
                 config.update(saved_config)
@@ -67,8 +95,8 @@ def save_config(config):
     """Save configuration to file"""
     try:
         CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        # Stays indented so the file remains easy to edit by hand
+        atomic_write(CONFIG_FILE, orjson.dumps(config, option=orjson.OPT_INDENT_2))
         return True
     except Exception as e:
         logging.error(f"Error saving config: {e}")
@@ -76,8 +104,30 @@ def save_config(config):
 
 CONFIG = load_config()
 
+# Keys are emitted in insertion order; sorting them only costs time on polled endpoints
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson"""
+
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB max upload
 app.config['UPLOAD_FOLDER'] = Path(CONFIG['DATA_DIR']) / 'uploads'
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -87,57 +137,94 @@ log_dir = Path(CONFIG['DATA_DIR'])
 log_dir.mkdir(parents=True, exist_ok=True)
 app.config['UPLOAD_FOLDER'].mkdir(parents=True, exist_ok=True)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_dir / 'application.log'),
-        logging.StreamHandler()
-    ]
-)
+# Worker threads only enqueue records; a single listener thread does the file/console I/O
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_handlers = [logging.FileHandler(log_dir / 'application.log'), logging.StreamHandler()]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 logger = logging.getLogger(__name__)
 
-# Results file path
+# Results storage paths (the JSON file is only read once to migrate into the database)
 RESULTS_FILE = Path(CONFIG['DATA_DIR']) / 'search_results.json'
+RESULTS_DB = Path(CONFIG['DATA_DIR']) / 'search_results.db'
+SAVE_DEBOUNCE_SECONDS = 2.0
 WATCHLIST_FILE = Path(CONFIG['DATA_DIR']) / 'watch_list.json'
 QUEUE_FILE = Path(CONFIG['DATA_DIR']) / 'queue.json'
 STATE_FILE = Path(CONFIG['DATA_DIR']) / 'state.json'
+STATE_SAVE_INTERVAL = 1.0  # Seconds between state.json writes for progress ticks
+
+# Guards search_state updates and state.json writes from concurrent search workers
+state_lock = threading.RLock()
+
+# Set by /search/cancel; workers check it and waits on it return early
+search_cancelled = threading.Event()
+
+# Set to wake the watchlist monitor before its interval is up (e.g. after settings change)
+watchlist_wake = threading.Event()
+
+_iso_cache = (0, '')  # (epoch second, ISO timestamp) reused within the same second
+
+
+def now_iso() -> str:
+    """Current local time as an ISO string, formatted at most once per second"""
+    global _iso_cache
+    t = int(time.time())
+    cached = _iso_cache
+    if cached[0] != t:
+        cached = (t, datetime.fromtimestamp(t).isoformat())
+        _iso_cache = cached
+    return cached[1]
 
 
 class QueueManager:
     """Manages the persistent search queue"""
     def __init__(self):
         self.queue = []
+        self.keys = set()  # Keys of queued items, kept in step with self.queue
         self.lock = threading.RLock()
         self.load_queue()
 
+    @staticmethod
+    def _item_key(item: Dict) -> str:
+        return f"{item['artist']}-{item['title']}"
+
     def load_queue(self):
         """Load queue from disk"""
         if QUEUE_FILE.exists():
             try:
-                with open(QUEUE_FILE, 'r', encoding='utf-8') as f:
-                    self.queue = json.load(f)
+                with open(QUEUE_FILE, 'rb') as f:
+                    self.queue = orjson.loads(f.read())
+                self.keys = {self._item_key(i) for i in self.queue}
             except Exception as e:
                 logger.error(f"Error loading queue: {e}")
                 self.queue = []
+                self.keys = set()
 
     def save_queue(self):
         """Save queue to disk"""
         try:
-            with open(QUEUE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.queue, f, indent=2)
+            atomic_write(QUEUE_FILE, orjson.dumps(self.queue))
         except Exception as e:
             logger.error(f"Error saving queue: {e}")
 
     def add_items(self, items: List[Dict]):
         """Add items to queue"""
         with self.lock:
-            # Avoid duplicates
-            current_keys = {f"{i['artist']}-{i['title']}" for i in self.queue}
+            # Avoid duplicates, including repeats within this batch
             new_items = []
             for item in items:
-                key = f"{item['artist']}-{item['title']}"
-                if key not in current_keys:
+                key = self._item_key(item)
+                if key not in self.keys:
+                    self.keys.add(key)
                     new_items.append(item)
             
             self.queue.extend(new_items)
@@ -149,14 +236,25 @@ class QueueManager:
         with self.lock:
             if self.queue:
                 item = self.queue.pop(0)
+                self.keys.discard(self._item_key(item))
                 self.save_queue()
                 return item
             return None
 
+    def drain(self) -> List[Dict]:
+        """Take every queued item at once, rewriting the queue file a single time"""
+        with self.lock:
+            items, self.queue = self.queue, []
+            self.keys = set()
+            if items:
+                self.save_queue()
+            return items
+
     def clear(self):
         """Clear the queue"""
         with self.lock:
             self.queue = []
+            self.keys = set()
             self.save_queue()
 
     def get_count(self) -> int:
@@ -165,18 +263,18 @@ class QueueManager:
 
 def save_application_state(state: Dict):
     """Save application state to disk"""
-    try:
-        with open(STATE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(state, f, indent=2)
-    except Exception as e:
-        logger.error(f"Error saving state: {e}")
+    with state_lock:
+        try:
+            atomic_write(STATE_FILE, orjson.dumps(state))
+        except Exception as e:
+            logger.error(f"Error saving state: {e}")
 
 def load_application_state() -> Dict:
     """Load application state from disk"""
     if STATE_FILE.exists():
         try:
-            with open(STATE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(STATE_FILE, 'rb') as f:
+                return orjson.loads(f.read())
         except Exception as e:
             logger.error(f"Error loading state: {e}")
     return {
@@ -189,7 +287,76 @@ def load_application_state() -> Dict:
     }
 
 
-def calculate_quality_score(file_info: Dict, requested_title: str = "", musicbrainz_metadata: Optional[Dict] = None) -> float:
+@dataclass(slots=True)
+class FileResult:
+    """A single Slskd file offered for a track (slots keep stored results compact)"""
+    username: str = ''
+    filename: str = ''
+    size: int = 0
+    bitrate: int = 0
+    extension: str = ''
+    queue_length: int = 0
+    speed_kbs: float = 0
+    has_free_slot: bool = False
+    is_locked: bool = False
+    requested_title: str = ''
+    quality_score: float = 0
+    duration_seconds: Optional[float] = None
+    size_mb: float = field(init=False, default=0)  # Precomputed for exports
+
+    def __post_init__(self):
+        self.size_mb = round(self.size / (1024 * 1024), 2)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'FileResult':
+        """Build from a stored JSON object, ignoring unknown and derived keys"""
+        return cls(**{name: data[name] for name, f in cls.__dataclass_fields__.items() if f.init and name in data})
+
+    @classmethod
+    def from_slskd(cls, file_info: Dict, requested_title: str = '') -> 'FileResult':
+        """Build from a raw file entry in a Slskd search response"""
+        filename = file_info.get('filename', '')
+        upload_speed = file_info.get('uploadSpeed', 0)
+        return cls(
+            username=file_info.get('username', 'Unknown'),
+            filename=filename,
+            size=file_info.get('size', 0),
+            bitrate=file_info.get('bitRate', 0),
+            extension=file_extension(filename),
+            queue_length=file_info.get('queueLength', 0),
+            speed_kbs=upload_speed / 1024 if upload_speed else 0,
+            has_free_slot=file_info.get('hasFreeUploadSlot', False),
+            is_locked=file_info.get('isLocked', False),
+            requested_title=requested_title  # Used for fuzzy matching
+        )
+
+
+# Lookup tables used by the per-file scoring and filtering below
+LOSSLESS_EXTENSIONS = frozenset(('flac', 'wav', 'alac', 'ape'))
+VIDEO_EXTENSIONS = frozenset(('mkv', 'mp4', 'avi', 'mov', 'wmv', 'flv', 'webm', 'mpg', 'mpeg', 'm4v'))
+TITLE_BLACKLIST = ('instrumental', 'karaoke', 'cover', 'live', 'remix', 'acapella')
+HARD_MAX_QUEUE_LENGTH = 1000  # Peers queued beyond this are never shown; also applied by Slskd itself
+
+
+@functools.lru_cache(maxsize=1024)
+def title_profile(requested_title: str) -> Tuple[str, Tuple[str, ...]]:
+    """Lowercased title and the blacklist words it doesn't contain, shared by every file scored for it"""
+    clean_title = requested_title.lower()
+    return clean_title, tuple(word for word in TITLE_BLACKLIST if word not in clean_title)
+
+
+def file_stem(filename: str) -> str:
+    """Same as Path(filename).stem, without building a Path for every search result"""
+    name = filename
+    if '/' in name or name == '.':
+        # Slskd paths use backslashes; mirror Path's handling of '/' separators and '.' parts
+        parts = [part for part in name.split('/') if part and part != '.']
+        name = parts[-1] if parts else ''
+    i = name.rfind('.')
+    return name[:i] if 0 < i < len(name) - 1 else name
+
+
+def calculate_quality_score(file_info: FileResult, requested_title: str = "", musicbrainz_metadata: Optional[Dict] = None) -> float:
     """
     Calculate quality score for a file based on:
     - Fuzzy Name Match (critical)
@@ -200,18 +367,28 @@ def calculate_quality_score(file_info: Dict, requested_title: str = "", musicbra
     - Queue Length
     """
     score = 0.0
-    filename = file_info.get('filename', '')
+    filename = file_info.filename
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    # MusicBrainz values used by the checks below, read once per file rather than per check
+    mb_album = ''
+    mb_duration_seconds = None
+    if musicbrainz_metadata:
+        if musicbrainz_metadata.get('album'):
+            mb_album = musicbrainz_metadata['album'].lower()
+        if musicbrainz_metadata.get('duration_ms'):
+            mb_duration_seconds = musicbrainz_metadata['duration_ms'] / 1000.0
+    file_path_lower = filename.lower() if mb_album else ''
 
     # 1. Fuzzy Name Match (+100pts)
     if requested_title:
         # Clean up filename for comparison (remove extension, underscores)
-        clean_filename = Path(filename).stem.replace('_', ' ').replace('-', ' ').lower()
-        clean_title = requested_title.lower()
+        clean_filename = file_stem(filename).replace('_', ' ').replace('-', ' ').lower()
+        clean_title, unwanted_words = title_profile(requested_title)
 
         # Negative Filtering (Blacklist)
-        blacklist = ['instrumental', 'karaoke', 'cover', 'live', 'remix', 'acapella']
-        for word in blacklist:
-            if word in clean_filename and word not in clean_title:
+        for word in unwanted_words:
+            if word in clean_filename:
                 score -= 500  # Heavy penalty for unwanted versions
 
         # Check for exact containment first
@@ -219,8 +396,7 @@ def calculate_quality_score(file_info: Dict, requested_title: str = "", musicbra
             score += 50
 
         # Fuzzy match ratio
-        matcher = difflib.SequenceMatcher(None, clean_title, clean_filename)
-        ratio = matcher.ratio()
+        ratio = fuzz.ratio(clean_title, clean_filename) / 100.0
         if ratio > 0.85:  # Stricter threshold
             score += 100
         elif ratio > 0.7:
@@ -229,63 +405,62 @@ def calculate_quality_score(file_info: Dict, requested_title: str = "", musicbra
             score -= 100  # Irrelevant result
 
     # NEW: Album Verification (if MusicBrainz data available)
-    if musicbrainz_metadata and musicbrainz_metadata.get('album'):
-        official_album = musicbrainz_metadata['album'].lower()
+    if mb_album:
         # Check if album name is in the file path (Slskd often returns full path)
         # We don't have full path in file_info usually, just filename. 
         # But sometimes 'directory' or similar field exists. 
         # Assuming filename might contain album or we just skip if not available.
         # Actually, Slskd search results often don't have directory unless we ask for it.
         # Let's check filename for now.
-        if official_album in filename.lower():
+        if mb_album in file_path_lower:
             score += 30
 
     # 2. Duration Verification (MusicBrainz)
-    if musicbrainz_metadata and musicbrainz_metadata.get('duration_ms'):
-        mb_duration_seconds = musicbrainz_metadata['duration_ms'] / 1000.0
-        file_duration = file_info.get('duration_seconds')  # This comes from Slskd file length
+    if mb_duration_seconds:
+        file_duration = file_info.duration_seconds  # This comes from Slskd file length
 
         if file_duration:
             duration_diff = abs(mb_duration_seconds - file_duration)
             if duration_diff <= 2:
                 # Perfect match (within 2 seconds)
                 score += 100
-                logger.debug(f"[QUALITY] Duration perfect match: {file_duration}s vs {mb_duration_seconds:.1f}s (diff: {duration_diff:.1f}s)")
+                if debug:
+                    logger.debug(f"[QUALITY] Duration perfect match: {file_duration}s vs {mb_duration_seconds:.1f}s (diff: {duration_diff:.1f}s)")
             elif duration_diff <= 5:
                 # Good match (within 5 seconds)
                 score += 50
-                logger.debug(f"[QUALITY] Duration good match: {file_duration}s vs {mb_duration_seconds:.1f}s (diff: {duration_diff:.1f}s)")
+                if debug:
+                    logger.debug(f"[QUALITY] Duration good match: {file_duration}s vs {mb_duration_seconds:.1f}s (diff: {duration_diff:.1f}s)")
             elif duration_diff <= 10:
                 # Acceptable match
                 score += 20
-                logger.debug(f"[QUALITY] Duration acceptable match: {file_duration}s vs {mb_duration_seconds:.1f}s (diff: {duration_diff:.1f}s)")
+                if debug:
+                    logger.debug(f"[QUALITY] Duration acceptable match: {file_duration}s vs {mb_duration_seconds:.1f}s (diff: {duration_diff:.1f}s)")
             else:
                 # Likely wrong version (radio edit, extended, etc.)
                 score -= 200
-                logger.debug(f"[QUALITY] Duration mismatch penalty: {file_duration}s vs {mb_duration_seconds:.1f}s (diff: {duration_diff:.1f}s)")
+                if debug:
+                    logger.debug(f"[QUALITY] Duration mismatch penalty: {file_duration}s vs {mb_duration_seconds:.1f}s (diff: {duration_diff:.1f}s)")
 
     # 3. Album Verification (MusicBrainz)
-    if musicbrainz_metadata and musicbrainz_metadata.get('album'):
-        mb_album = musicbrainz_metadata['album'].lower()
-        # Extract potential album name from file path
-        file_path_lower = filename.lower()
-
+    if mb_album:
         # Fuzzy match album name in file path
-        matcher = difflib.SequenceMatcher(None, mb_album, file_path_lower)
-        ratio = matcher.ratio()
+        ratio = fuzz.ratio(mb_album, file_path_lower) / 100.0
 
         if ratio > 0.7:
             score += 75
-            logger.debug(f"[QUALITY] Album match bonus: '{mb_album}' found in path (ratio: {ratio:.2f})")
+            if debug:
+                logger.debug(f"[QUALITY] Album match bonus: '{mb_album}' found in path (ratio: {ratio:.2f})")
         elif ratio > 0.5:
             score += 30
-            logger.debug(f"[QUALITY] Album partial match: '{mb_album}' (ratio: {ratio:.2f})")
+            if debug:
+                logger.debug(f"[QUALITY] Album partial match: '{mb_album}' (ratio: {ratio:.2f})")
 
     # 4. Bitrate Tiering
-    bitrate = file_info.get('bitrate', 0)
-    extension = file_info.get('extension', '').lower()
+    bitrate = file_info.bitrate
+    extension = file_info.extension.lower()
 
-    if extension in ['flac', 'wav', 'alac', 'ape']:
+    if extension in LOSSLESS_EXTENSIONS:
         score += 50
     elif bitrate >= 320:
         score += 40
@@ -295,7 +470,7 @@ def calculate_quality_score(file_info: Dict, requested_title: str = "", musicbra
         score -= 100  # Instant reject for low quality
 
     # 5. Queue Penalty
-    queue_length = file_info.get('queue_length', 0)
+    queue_length = file_info.queue_length
     if queue_length == 0:
         score += 50
     elif queue_length <= 3:
@@ -304,7 +479,7 @@ def calculate_quality_score(file_info: Dict, requested_title: str = "", musicbra
         score -= 100  # Reject heavy queues
 
     # 6. Speed scoring (minor factor)
-    speed_kbs = file_info.get('speed_kbs', 0)
+    speed_kbs = file_info.speed_kbs
     if speed_kbs >= 1000:
         score += 20
     elif speed_kbs >= 100:
@@ -313,7 +488,7 @@ def calculate_quality_score(file_info: Dict, requested_title: str = "", musicbra
     return score
 
 
-def passes_quality_filters(file_info: Dict) -> bool:
+def passes_quality_filters(file_info: FileResult, max_size_bytes: Optional[int] = None) -> bool:
     """
     Apply strict quality filters to determine if a file should be shown.
 
@@ -324,23 +499,25 @@ def passes_quality_filters(file_info: Dict) -> bool:
     - File must not be locked
     - File must not be a video
     - File size must be <= MAX_FILE_SIZE_MB
+
+    max_size_bytes can be passed in to avoid re-reading CONFIG for every file.
     """
-    extension = file_info.get('extension', '').lower()
-    bitrate = file_info.get('bitrate', 0)
-    queue_length = file_info.get('queue_length', 0)
-    speed_kbs = file_info.get('speed_kbs', 0)
-    is_locked = file_info.get('is_locked', False)
-    file_size = file_info.get('size', 0)
-    filename = file_info.get('filename', '')
+    extension = file_info.extension.lower()
+    bitrate = file_info.bitrate
+    queue_length = file_info.queue_length
+    speed_kbs = file_info.speed_kbs
+    is_locked = file_info.is_locked
+    file_size = file_info.size
+    filename = file_info.filename
 
     # Reject video files
-    video_extensions = ['mkv', 'mp4', 'avi', 'mov', 'wmv', 'flv', 'webm', 'mpg', 'mpeg', 'm4v']
-    if extension in video_extensions:
+    if extension in VIDEO_EXTENSIONS:
         logger.debug(f"[FILTER] REJECTED: {filename} - Video file (.{extension})")
         return False
 
     # Reject files over size limit
-    max_size_bytes = CONFIG['MAX_FILE_SIZE_MB'] * 1024 * 1024
+    if max_size_bytes is None:
+        max_size_bytes = CONFIG['MAX_FILE_SIZE_MB'] * 1024 * 1024
     if file_size > max_size_bytes:
         size_mb = file_size / (1024 * 1024)
         logger.debug(f"[FILTER] REJECTED: {filename} - Too large ({size_mb:.1f}MB > {CONFIG['MAX_FILE_SIZE_MB']}MB)")
@@ -352,7 +529,7 @@ def passes_quality_filters(file_info: Dict) -> bool:
         return False
 
     # Queue too long (Soft filter - handled by scoring, but reject extreme cases)
-    if queue_length > 1000: # Was CONFIG['MAX_QUEUE_LENGTH']
+    if queue_length > HARD_MAX_QUEUE_LENGTH: # Was CONFIG['MAX_QUEUE_LENGTH']
         logger.debug(f"[FILTER] REJECTED: {filename} - Queue too long ({queue_length})")
         return False
 
@@ -362,16 +539,18 @@ def passes_quality_filters(file_info: Dict) -> bool:
     #     return False
 
     # Bitrate check (Soft filter)
-    # if extension not in ['flac', 'wav', 'alac', 'ape']:
+    # if extension not in LOSSLESS_EXTENSIONS:
     #     if bitrate < CONFIG['MIN_BITRATE']:
     #         logger.debug(f"[FILTER] REJECTED: {filename} - Bitrate too low ({bitrate} kbps)")
     #         return False
 
-    logger.debug(f"[FILTER] ACCEPTED: {filename} - {extension}, {bitrate}kbps, Q:{queue_length}, {speed_kbs}KB/s")
+    # Runs for every kept file, so skip building the message unless debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[FILTER] ACCEPTED: {filename} - {extension}, {bitrate}kbps, Q:{queue_length}, {speed_kbs}KB/s")
     return True
 
 
-def rank_and_filter_results(results: List[Dict], musicbrainz_metadata: Optional[Dict] = None) -> List[Dict]:
+def rank_and_filter_results(results: List[FileResult], musicbrainz_metadata: Optional[Dict] = None) -> List[FileResult]:
     """
     Filter results based on quality criteria and return top N ranked results.
 
@@ -382,18 +561,22 @@ def rank_and_filter_results(results: List[Dict], musicbrainz_metadata: Optional[
     Returns:
         List of top quality results, ranked by score
     """
+    # Collapse repeated (user, file) entries so duplicates are neither scored twice nor ranked twice
+    results = list({(r.username, r.filename): r for r in results}.values())
+
     # First, filter out low-quality results
     filtered_results = []
     rejected_count = 0
     
     logger.info(f"[FILTER] Starting filtering for {len(results)} results")
-    
+
+    max_size_bytes = CONFIG['MAX_FILE_SIZE_MB'] * 1024 * 1024
     for result in results:
-        if passes_quality_filters(result):
+        if passes_quality_filters(result, max_size_bytes):
             # Calculate quality score with MusicBrainz data
-            result['quality_score'] = calculate_quality_score(
+            result.quality_score = calculate_quality_score(
                 result,
-                result.get('requested_title', ''),
+                result.requested_title,
                 musicbrainz_metadata
             )
             filtered_results.append(result)
@@ -402,31 +585,124 @@ def rank_and_filter_results(results: List[Dict], musicbrainz_metadata: Optional[
 
     logger.info(f"[FILTER] Kept {len(filtered_results)} results, rejected {rejected_count}")
 
-    # Sort by quality score (descending)
-    filtered_results.sort(key=lambda x: x['quality_score'], reverse=True)
-
-    # Return top N results
+    # Select the top N by quality score without sorting the whole list
     top_count = CONFIG.get('TOP_RESULTS_COUNT', 5)
-    return filtered_results[:top_count]
+    return heapq.nlargest(top_count, filtered_results, key=attrgetter('quality_score'))
 
 
 class SearchManager:
     """Manages search operations and result storage"""
 
     def __init__(self):
-        self.results = self._load_results()
         self.lock = threading.RLock()  # Use RLock to allow reentrant locking
+        self.db = self._connect()
+        self.results = self._load_results()
+        self._count_stats()
+        # Live artist grouping for the dashboard, with names kept in sorted order
+        self._artist_groups = self.get_results_by_artist()
+        self._artist_names = sorted(self._artist_groups)
+        self._group_snapshots = {}  # artist -> copied group, refreshed only when that artist changes
+        self._changed_artists = set(self._artist_names)
+
+        # Commits are coalesced by a background flusher instead of one per mutation
+        self._dirty = threading.Event()
+        threading.Thread(target=self._flush_loop, daemon=True).start()
+        atexit.register(self.flush)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the results database and create the schema if needed"""
+        conn = sqlite3.connect(RESULTS_DB, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS albums (
+                album_key TEXT PRIMARY KEY,
+                name TEXT,
+                artist TEXT
+            );
+            CREATE TABLE IF NOT EXISTS tracks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                album_key TEXT NOT NULL,
+                title TEXT NOT NULL,
+                data TEXT NOT NULL,
+                UNIQUE (album_key, title)
+            );
+            CREATE TABLE IF NOT EXISTS legacy_tracks (
+                key TEXT PRIMARY KEY,
+                data TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                name TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        return conn
 
     def _load_results(self) -> Dict:
-        """Load existing search results from JSON file"""
+        """Load search results from the database, migrating the old JSON file once"""
+        with self.lock:
+            row = self.db.execute("SELECT value FROM meta WHERE name = 'json_migrated'").fetchone()
+            if not row:
+                self._migrate_json_results()
+
+            results = self._create_empty_results()
+            row = self.db.execute("SELECT value FROM meta WHERE name = 'last_updated'").fetchone()
+            results['last_updated'] = row[0] if row else None
+
+            for album_key, name, artist in self.db.execute("SELECT album_key, name, artist FROM albums"):
+                results['albums'][album_key] = {'name': name, 'artist': artist, 'tracks': []}
+            for album_key, data in self.db.execute("SELECT album_key, data FROM tracks ORDER BY id"):
+                if album_key in results['albums']:
+                    results['albums'][album_key]['tracks'].append(self._decode_track(data))
+            for key, data in self.db.execute("SELECT key, data FROM legacy_tracks"):
+                results['tracks'][key] = self._decode_track(data)
+
+            return results
+
+    @staticmethod
+    def _decode_track(data) -> Dict:
+        """Decode a stored track row, turning its results back into FileResult objects"""
+        track = orjson.loads(data)
+        track['results'] = [FileResult.from_dict(r) for r in track.get('results', [])]
+        return track
+
+    def _migrate_json_results(self):
+        """Import an existing search_results.json into the database"""
+        data = {}
         if RESULTS_FILE.exists():
             try:
-                with open(RESULTS_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                # Parse straight from the mapped file instead of copying it into a bytes object
+                with open(RESULTS_FILE, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = orjson.loads(memoryview(mm))
             except Exception as e:
                 logger.error(f"Error loading results file: {e}")
-                return self._create_empty_results()
-        return self._create_empty_results()
+
+        try:
+            with self.db:
+                for album_key, album_data in data.get('albums', {}).items():
+                    self.db.execute(
+                        "INSERT OR IGNORE INTO albums (album_key, name, artist) VALUES (?, ?, ?)",
+                        (album_key, album_data.get('name'), album_data.get('artist'))
+                    )
+                    for track in album_data.get('tracks', []):
+                        self.db.execute(
+                            "INSERT OR REPLACE INTO tracks (album_key, title, data) VALUES (?, ?, ?)",
+                            (album_key, track.get('title', ''), orjson.dumps(track))
+                        )
+                # Older files stored everything under 'artists'
+                legacy = data.get('tracks') or data.get('artists') or {}
+                for key, track in legacy.items():
+                    self.db.execute(
+                        "INSERT OR REPLACE INTO legacy_tracks (key, data) VALUES (?, ?)",
+                        (key, orjson.dumps(track))
+                    )
+                if data.get('last_updated'):
+                    self._set_meta('last_updated', data['last_updated'])
+                self._set_meta('json_migrated', datetime.now().isoformat())
+            if data:
+                logger.info(f"Migrated {RESULTS_FILE} into {RESULTS_DB}")
+        except sqlite3.Error as e:
+            logger.error(f"Error migrating results file: {e}")
 
     def _create_empty_results(self) -> Dict:
         """Create empty results structure"""
@@ -436,16 +712,46 @@ class SearchManager:
             'tracks': {}   # Legacy/Fallback
         }
 
+    def _set_meta(self, name: str, value: str):
+        self.db.execute(
+            "INSERT INTO meta (name, value) VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+            (name, value)
+        )
+
+    def _write(self, sql: str, params: tuple):
+        """Stage a single row change; it is committed by save_results"""
+        with self.lock:
+            try:
+                self.db.execute(sql, params)
+            except sqlite3.Error as e:
+                logger.error(f"Error writing results row: {e}")
+
     def save_results(self):
-        """Save results to JSON file"""
+        """Mark results as changed; the flusher commits them shortly after"""
         with self.lock:
-            self.results['last_updated'] = datetime.now().isoformat()
+            self.results['last_updated'] = now_iso()
+            self._dirty.set()
+
+    def _flush_loop(self):
+        """Background loop that batches pending changes into one commit"""
+        while True:
+            self._dirty.wait()
+            time.sleep(SAVE_DEBOUNCE_SECONDS)
+            self.flush()
+
+    def flush(self):
+        """Commit staged row changes to the results database"""
+        with self.lock:
+            if not self._dirty.is_set():
+                return
+            self._dirty.clear()
             try:
-                with open(RESULTS_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(self.results, f, indent=2, ensure_ascii=False)
+                self._set_meta('last_updated', self.results['last_updated'])
+                self.db.commit()
                 logger.info("Results saved successfully")
-            except Exception as e:
+            except sqlite3.Error as e:
                 logger.error(f"Error saving results: {e}")
+                self.db.rollback()
 
     def get_track_results(self, track_key: str) -> Optional[Dict]:
         """Get results for a specific track"""
@@ -457,60 +763,72 @@ class SearchManager:
             return self.results['artists'].get(track_key)
         return None
 
+    def get_track_keys(self):
+        """Keys that get_track_results can resolve, as a set-like view"""
+        return self.results.get('tracks', {}).keys()
+
     def mark_reviewed(self, track_key: str) -> bool:
         """Mark a track as reviewed"""
-        tracks = self.results.get('tracks', {})
-        if track_key in tracks:
-            tracks[track_key]['reviewed'] = True
-            self.save_results()
-            return True
-        return False
+        with self.lock:
+            tracks = self.results.get('tracks', {})
+            if track_key in tracks:
+                self._apply_stats(tracks[track_key], -1)
+                tracks[track_key]['reviewed'] = True
+                self._apply_stats(tracks[track_key], 1)
+                self._write(
+                    "UPDATE legacy_tracks SET data = ? WHERE key = ?",
+                    (orjson.dumps(tracks[track_key]), track_key)
+                )
+                self.save_results()
+                return True
+            return False
 
     def delete_track(self, track_key: str) -> bool:
         """Delete a track's results"""
-        tracks = self.results.get('tracks', {})
-        if track_key in tracks:
-            del tracks[track_key]
-            self.save_results()
-            return True
-        return False
+        with self.lock:
+            tracks = self.results.get('tracks', {})
+            if track_key in tracks:
+                track = tracks.pop(track_key)
+                self._apply_stats(track, -1)
+                self._unindex_track(track)
+                self._write("DELETE FROM legacy_tracks WHERE key = ?", (track_key,))
+                self.save_results()
+                return True
+            return False
+
+    @staticmethod
+    def _stat_contribution(track: Dict) -> Dict:
+        """Amount a single track adds to each counter in get_stats"""
+        result_count = track.get('result_count', 0)
+        return {
+            'total_tracks': 1,
+            'tracks_with_results': 1 if result_count > 0 else 0,
+            'reviewed_tracks': 1 if track.get('reviewed', False) else 0,
+            'total_files': result_count
+        }
 
-    def get_stats(self) -> Dict:
-        """Calculate statistics"""
-        # Count tracks from both new 'albums' structure and legacy 'tracks'
-        total_tracks = 0
-        tracks_with_results = 0
-        reviewed_tracks = 0
-        total_files = 0
+    def _apply_stats(self, track: Dict, sign: int):
+        """Add (sign=1) or remove (sign=-1) a track's contribution to the counters"""
+        for name, value in self._stat_contribution(track).items():
+            self._stats[name] += sign * value
 
-        # Count from Albums
-        albums = self.results.get('albums', {})
-        for album in albums.values():
+    def _count_stats(self):
+        """Build the counters from scratch (done once after loading)"""
+        self._stats = {'total_tracks': 0, 'tracks_with_results': 0, 'reviewed_tracks': 0, 'total_files': 0}
+
+        # Count tracks from both new 'albums' structure and legacy 'tracks'
+        for album in self.results.get('albums', {}).values():
             for track in album.get('tracks', []):
-                total_tracks += 1
-                if track.get('result_count', 0) > 0:
-                    tracks_with_results += 1
-                if track.get('reviewed', False):
-                    reviewed_tracks += 1
-                total_files += track.get('result_count', 0)
-
-        # Count from Legacy Tracks (if any)
-        tracks = self.results.get('tracks', {})
-        for track in tracks.values():
-            total_tracks += 1
-            if track.get('result_count', 0) > 0:
-                tracks_with_results += 1
-            if track.get('reviewed', False):
-                reviewed_tracks += 1
-            total_files += track.get('result_count', 0)
+                self._apply_stats(track, 1)
+        for track in self.results.get('tracks', {}).values():
+            self._apply_stats(track, 1)
 
-        return {
-            'total_tracks': total_tracks,
-            'tracks_with_results': tracks_with_results,
-            'reviewed_tracks': reviewed_tracks,
-            'total_files': total_files,
-            'last_updated': self.results.get('last_updated')
-        }
+    def get_stats(self) -> Dict:
+        """Return statistics from the incrementally maintained counters"""
+        with self.lock:
+            stats = self._stats.copy()
+            stats['last_updated'] = self.results.get('last_updated')
+            return stats
 
     def add_track_results(self, track_key: str, artist: str, title: str, album: str, results: List[Dict],
                          search_id: str = "", musicbrainz_metadata: Optional[Dict] = None, status: str = None):
@@ -529,6 +847,10 @@ class SearchManager:
                     'artist': artist,
                     'tracks': []
                 }
+                self._write(
+                    "INSERT OR IGNORE INTO albums (album_key, name, artist) VALUES (?, ?, ?)",
+                    (album_key, album_name, artist)
+                )
 
             # Find if track already exists in this album
             album_data = self.results['albums'][album_key]
@@ -542,7 +864,7 @@ class SearchManager:
                 'artist': artist,
                 'title': title,
                 'album': album_name,
-                'searched_at': datetime.now().isoformat(),
+                'searched_at': now_iso(),
                 'result_count': len(results),
                 'reviewed': False,
                 'search_id': search_id,
@@ -556,11 +878,25 @@ class SearchManager:
 
             if existing_track:
                 # Update existing
+                self._apply_stats(existing_track, -1)
+                had_results = existing_track.get('result_count', 0) > 0
                 existing_track.update(track_data)
+                track_data = existing_track
+                group = self._artist_groups.get(track_data.get('artist', 'Unknown Artist'))
+                if group:
+                    group['stats']['found'] += (track_data.get('result_count', 0) > 0) - had_results
+                    self._changed_artists.add(track_data.get('artist', 'Unknown Artist'))
             else:
                 # Add new
                 album_data['tracks'].append(track_data)
+                self._index_track(track_data)
+            self._apply_stats(track_data, 1)
 
+            self._write(
+                "INSERT INTO tracks (album_key, title, data) VALUES (?, ?, ?) "
+                "ON CONFLICT(album_key, title) DO UPDATE SET data = excluded.data",
+                (album_key, title, orjson.dumps(track_data))
+            )
             self.save_results()
 
     def add_result(self, result: Dict):
@@ -592,44 +928,101 @@ class SearchManager:
         """
         grouped = {}
 
-        # Helper to add track to grouped structure
-        def add_track(track):
-            artist = track.get('artist', 'Unknown Artist')
-            album = track.get('album', 'Unknown Album')
-            
-            if artist not in grouped:
-                grouped[artist] = {
-                    'stats': {'total': 0, 'found': 0, 'downloaded': 0},
-                    'albums': {},
-                    'singles': []
-                }
-            
-            # Update stats
-            grouped[artist]['stats']['total'] += 1
-            if track.get('result_count', 0) > 0:
-                grouped[artist]['stats']['found'] += 1
-            
-            # Add to album or singles
-            if album and album != 'Unknown Album':
-                if album not in grouped[artist]['albums']:
-                    grouped[artist]['albums'][album] = []
-                grouped[artist]['albums'][album].append(track)
-            else:
-                grouped[artist]['singles'].append(track)
-
         # Process Albums
         albums = self.results.get('albums', {})
         for album_data in albums.values():
             for track in album_data.get('tracks', []):
-                add_track(track)
+                self._group_track(grouped, track)
 
         # Process Legacy Tracks
         tracks = self.results.get('tracks', {})
         for track in tracks.values():
-            add_track(track)
+            self._group_track(grouped, track)
             
         return grouped
 
+    @staticmethod
+    def _group_track(grouped: Dict, track: Dict) -> bool:
+        """Add a track to an artist grouping; returns True if the artist is new"""
+        artist = track.get('artist', 'Unknown Artist')
+        album = track.get('album', 'Unknown Album')
+        is_new = artist not in grouped
+
+        if is_new:
+            grouped[artist] = {
+                'stats': {'total': 0, 'found': 0, 'downloaded': 0},
+                'albums': {},
+                'singles': []
+            }
+
+        # Update stats
+        grouped[artist]['stats']['total'] += 1
+        if track.get('result_count', 0) > 0:
+            grouped[artist]['stats']['found'] += 1
+
+        # Add to album or singles
+        if album and album != 'Unknown Album':
+            grouped[artist]['albums'].setdefault(album, []).append(track)
+        else:
+            grouped[artist]['singles'].append(track)
+        return is_new
+
+    def _index_track(self, track: Dict):
+        """Add a new track to the live artist index, keeping names sorted"""
+        artist = track.get('artist', 'Unknown Artist')
+        if self._group_track(self._artist_groups, track):
+            bisect.insort(self._artist_names, artist)
+        self._changed_artists.add(artist)
+
+    def _unindex_track(self, track: Dict):
+        """Remove a deleted track from the live artist index"""
+        artist = track.get('artist', 'Unknown Artist')
+        album = track.get('album', 'Unknown Album')
+        group = self._artist_groups.get(artist)
+        if group is None:
+            return
+        self._changed_artists.add(artist)
+
+        group['stats']['total'] -= 1
+        if track.get('result_count', 0) > 0:
+            group['stats']['found'] -= 1
+
+        if album and album != 'Unknown Album':
+            album_tracks = group['albums'].get(album, [])
+            if track in album_tracks:
+                album_tracks.remove(track)
+            if not album_tracks:
+                group['albums'].pop(album, None)
+        elif track in group['singles']:
+            group['singles'].remove(track)
+
+        if group['stats']['total'] <= 0:
+            del self._artist_groups[artist]
+            i = bisect.bisect_left(self._artist_names, artist)
+            if i < len(self._artist_names) and self._artist_names[i] == artist:
+                del self._artist_names[i]
+
+    def get_artist_page(self, page: int, per_page: int) -> Tuple[Dict, int]:
+        """One page of artist groups sorted by name, plus the total artist count"""
+        with self.lock:
+            # Copy only the groups that changed so rendering isn't affected by
+            # concurrent writes, without re-copying the whole library under the lock
+            for name in self._changed_artists:
+                group = self._artist_groups.get(name)
+                if group is None:
+                    self._group_snapshots.pop(name, None)
+                    continue
+                self._group_snapshots[name] = {
+                    'stats': dict(group['stats']),
+                    'albums': {album: list(tracks) for album, tracks in group['albums'].items()},
+                    'singles': list(group['singles'])
+                }
+            self._changed_artists.clear()
+
+            start = (page - 1) * per_page
+            names = self._artist_names[start:start + per_page]
+            return {name: self._group_snapshots[name] for name in names}, len(self._artist_names)
+
     def get_all_tracks_flat(self) -> List[Dict]:
         """Get all tracks as a flat list for display"""
         all_tracks = []
@@ -658,6 +1051,10 @@ class SearchManager:
         return self.results.get('tracks', {}).get(key)
 
 
+# Pooled connections per Slskd host; requests defaults to 10, which concurrent searches can exceed
+SLSKD_POOL_SIZE = 32
+
+
 class SlskdClient:
     """Custom Slskd Client using requests"""
     def __init__(self, host, api_key, url_base='/'):
@@ -678,6 +1075,11 @@ class SlskdClient:
         self.headers = {'X-API-Key': self.api_key}
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        # One shared client serves the search workers, request handlers and the
+        # watchlist monitor; keep enough pooled keep-alive connections for all of them
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=SLSKD_POOL_SIZE)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
         # Only log if it's a new initialization (avoid noise from health checks)
         # logger.debug(f"SlskdClient initialized with Base URL: {self.base_url}")
@@ -721,7 +1123,14 @@ class SlskdClient:
         try:
             # Slskd expects search text in the body or query param? 
             # Based on docs/usage, usually POST to /search with {searchText: "..."}
-            response = self._request_with_retry('POST', url, json={'searchText': query}, timeout=10)
+            # Let Slskd drop responses from peers we would reject anyway
+            payload = {
+                'searchText': query,
+                'searchTimeout': int(timeout * 1000),  # Slskd takes milliseconds
+                'filterResponses': True,
+                'maximumPeerQueueLength': HARD_MAX_QUEUE_LENGTH
+            }
+            response = self._request_with_retry('POST', url, json=payload, timeout=10)
             return response.json()
         except Exception as e:
             logger.error(f"Search init failed for {url}: {e}")
@@ -782,11 +1191,69 @@ class SlskdClient:
             logger.error(f"[DOWNLOAD] ✗ Unexpected error for {filename} from {username}")
             logger.error(f"[DOWNLOAD] Error type: {type(e).__name__}")
             logger.error(f"[DOWNLOAD] Error message: {e}")
-            import traceback
             logger.error(f"[DOWNLOAD] Traceback: {traceback.format_exc()}")
             return None
 
 
+_slskd_client = None
+_slskd_client_settings = None
+_slskd_client_lock = threading.Lock()
+
+# Small pool for short Slskd calls made from request handlers, so a hung
+# Slskd can be bounded by a timeout instead of tying up the handler
+HEALTH_CHECK_TIMEOUT = 2
+slskd_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='slskd')
+
+
+def get_slskd_client() -> SlskdClient:
+    """Return the shared SlskdClient, recreating it if the connection settings changed"""
+    global _slskd_client, _slskd_client_settings
+    settings = (CONFIG['SLSKD_URL'], CONFIG['SLSKD_API_KEY'], CONFIG['SLSKD_URL_BASE'])
+    with _slskd_client_lock:
+        if _slskd_client is None or _slskd_client_settings != settings:
+            _slskd_client = SlskdClient(host=settings[0], api_key=settings[1], url_base=settings[2])
+            _slskd_client_settings = settings
+        return _slskd_client
+
+
+class SearchResultCache:
+    """Short-lived in-memory LRU cache of raw Slskd search files, keyed by normalized query"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # key -> (expires_at, files)
+        self.lock = threading.Lock()
+
+    def get(self, query: str) -> Optional[List[Dict]]:
+        """Return cached files for a query, or None on a miss or expired entry"""
+        key = canonicalize_name(query)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, query: str, files: List[Dict]):
+        """Cache files for a query; empty results are not cached"""
+        ttl = CONFIG.get('SEARCH_CACHE_TTL', 0)
+        if ttl <= 0 or not files:
+            return
+        key = canonicalize_name(query)
+        with self.lock:
+            self.entries[key] = (time.monotonic() + ttl, files)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, query: str):
+        with self.lock:
+            self.entries.pop(canonicalize_name(query), None)
+
+
 class WatchListManager:
     """Manages the watch list for busy users"""
 
@@ -797,8 +1264,8 @@ class WatchListManager:
     def _load_watchlist(self) -> List[Dict]:
         if WATCHLIST_FILE.exists():
             try:
-                with open(WATCHLIST_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(WATCHLIST_FILE, 'rb') as f:
+                    return orjson.loads(f.read())
             except Exception as e:
                 logger.error(f"Error loading watchlist: {e}")
                 return []
@@ -807,8 +1274,7 @@ class WatchListManager:
     def save_watchlist(self):
         with self.lock:
             try:
-                with open(WATCHLIST_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(self.watchlist, f, indent=2)
+                atomic_write(WATCHLIST_FILE, orjson.dumps(self.watchlist))
             except Exception as e:
                 logger.error(f"Error saving watchlist: {e}")
 
@@ -836,6 +1302,13 @@ class WatchListManager:
         pass
 
 
+def make_track_key(item: Dict) -> str:
+    """Results key for a parsed/queued item: "Artist - Title", or just the artist"""
+    artist = item.get('artist', '')
+    title = item.get('title', '')
+    return f"{artist} - {title}" if title else artist
+
+
 @app.route('/upload', methods=['POST'])
 def upload_file():
     """Handle CSV file upload"""
@@ -848,24 +1321,25 @@ def upload_file():
         
     if file:
         try:
-            # Save file
+            # Parse CSV straight from the upload so unusable files never reach disk
+            text = TextIOWrapper(file.stream, encoding='utf-8', newline='')
+            try:
+                artists = parse_csv_stream(text)
+            finally:
+                text.detach()  # Leave the underlying stream open for saving
+
+            if not artists:
+                return jsonify({'error': 'No artists found in CSV'}), 400
+
+            # Keep a copy of the accepted upload
             filename = secure_filename(file.filename)
-            filepath = app.config['UPLOAD_FOLDER'] / filename
-            file.save(filepath)
-            
-            # Parse CSV
-            artists = parse_spotify_csv(filepath)
+            file.stream.seek(0)
+            file.save(app.config['UPLOAD_FOLDER'] / filename)
             
             # Calculate stats
             total_artists = len(artists)
-            existing_artists = 0
-            
-            for artist in artists:
-                # Check if we already have results for this artist
-                key = f"{artist['artist']} - {artist['title']}" if artist.get('title') else artist['artist']
-                if search_manager.get_track_results(key):
-                    existing_artists += 1
-                    
+            existing_keys = search_manager.get_track_keys()
+            existing_artists = sum(1 for artist in artists if make_track_key(artist) in existing_keys)
             new_artists = total_artists - existing_artists
             
             return jsonify({
@@ -880,16 +1354,27 @@ def upload_file():
             logger.error(f"Upload error: {e}")
             return jsonify({'error': str(e)}), 500
 
+# Hiragana, katakana (full and half width) and CJK ideographs
+JAPANESE_CHARS = re.compile(r'[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uff66-\uff9f]')
+
+
 class Romanizer:
     """Handles Japanese to Romaji conversion"""
     def __init__(self):
         self.kks = pykakasi.kakasi()
+        # The same artist/album names repeat across many tracks; conversions are slow
+        self._convert = functools.lru_cache(maxsize=4096)(self._convert_uncached)
         
     def to_romaji(self, text: str) -> str:
         """Convert text to Romaji if it contains Japanese"""
         if not text:
             return ""
-            
+        if text.isascii() or not JAPANESE_CHARS.search(text):
+            # Nothing for pykakasi to convert
+            return text.strip()
+        return self._convert(text)
+
+    def _convert_uncached(self, text: str) -> str:
         result = self.kks.convert(text)
         romaji = " ".join([item['hepburn'] for item in result])
         return romaji.strip()
@@ -898,6 +1383,7 @@ class Romanizer:
 queue_manager = QueueManager()
 search_manager = SearchManager()
 watchlist_manager = WatchListManager()
+search_cache = SearchResultCache()
 romanizer = Romanizer()
 musicbrainz_client = MusicBrainzClient(user_agent="slskd-spotify-self-host/1.0 (https://github.com/yourusername/slskd-spotify-self-host)")
 isrc_tracker = ISRCTracker(data_dir=CONFIG['DATA_DIR'])
@@ -906,53 +1392,79 @@ isrc_tracker = ISRCTracker(data_dir=CONFIG['DATA_DIR'])
 search_state = load_application_state()
 
 
+# Accepted CSV column names, in order of preference
+ARTIST_COLUMNS = ('artist', 'Artist', 'Artist Name', 'ARTIST')
+TITLE_COLUMNS = ('title', 'Title', 'Track Name', 'Track', 'Song', 'Name')
+ALBUM_COLUMNS = ('album', 'Album', 'Album Name', 'ALBUM')
+# Header columns that identify a comma-separated Spotify export
+SPOTIFY_HEADER_COLUMNS = frozenset(('Track Name', 'Artist Name', 'Artist Name(s)', 'Album Name'))
+
+
+def canonicalize_name(name: str) -> str:
+    """Fold case, Latin accents and whitespace so spelling variants compare equal"""
+    # Only strip combining diacritics (U+0300-U+036F); other marks such as
+    # Japanese dakuten change the meaning of the character
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(c for c in decomposed if not '\u0300' <= c <= '\u036f')
+    return ' '.join(unicodedata.normalize('NFKC', stripped).casefold().split())
+
+
 def parse_spotify_csv(file_path: Path) -> List[Dict]:
-    """Parse CSV and extract artist, track, and album names"""
+    """Parse a CSV file and extract artist, track, and album names"""
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        return parse_csv_stream(f)
+
+
+def parse_csv_stream(f: TextIO) -> List[Dict]:
+    """Parse an open, seekable CSV text stream and extract artist, track, and album names"""
     tracks = []
+    seen_tracks = set()   # Canonical (artist, title) pairs already added
+    seen_artists = set()  # Canonical artists already added without a title
+    artist_spellings = {}  # Canonical artist -> first spelling seen in the file
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Try to detect CSV format
-        sniffer = csv.Sniffer()
-        try:
-            dialect = sniffer.sniff(content[:1024])
-            has_header = sniffer.has_header(content[:1024])
-        except:
+        # Spotify-style exports are plain comma-separated with a known header, so skip sniffing those
+        header = [column.strip().strip('"') for column in f.readline().split(',')]
+        if any(column in SPOTIFY_HEADER_COLUMNS for column in header):
             dialect = 'excel'
-            has_header = True
+        else:
+            # Try to detect CSV format from a small sample (DictReader always treats the first row as the header)
+            f.seek(0)
+            try:
+                dialect = csv.Sniffer().sniff(f.read(1024))
+            except:
+                dialect = 'excel'
+        f.seek(0)
+
+        # Parse CSV straight from the file rather than a full in-memory copy
+        reader = csv.DictReader(f, dialect=dialect)
 
-        # Parse CSV
-        reader = csv.DictReader(StringIO(content), dialect=dialect)
+        # Resolve which candidate columns this file has once, not on every row
+        fieldnames = reader.fieldnames or []
+        artist_cols = [c for c in ARTIST_COLUMNS if c in fieldnames]
+        title_cols = [c for c in TITLE_COLUMNS if c in fieldnames]
+        album_cols = [c for c in ALBUM_COLUMNS if c in fieldnames]
+
+        if not artist_cols:
+            logger.warning(f"No artist column found in CSV (columns: {fieldnames})")
+            return tracks
 
         for row in reader:
-            artist = None
-            title = None
-            album = None
-            
-            # Extract Artist (case-insensitive)
-            for col_name in ['artist', 'Artist', 'Artist Name', 'ARTIST']:
-                if col_name in row and row[col_name]:
-                    artist = row[col_name].strip()
-                    break
-            
-            # Extract Title (case-insensitive)
-            for col_name in ['title', 'Title', 'Track Name', 'Track', 'Song', 'Name']:
-                if col_name in row and row[col_name]:
-                    title = row[col_name].strip()
-                    break
-            
-            # Extract Album (case-insensitive)
-            for col_name in ['album', 'Album', 'Album Name', 'ALBUM']:
-                if col_name in row and row[col_name]:
-                    album = row[col_name].strip()
-                    break
+            # First non-empty value among the columns present
+            artist = next((row[c].strip() for c in artist_cols if row[c]), None)
+            title = next((row[c].strip() for c in title_cols if row[c]), None)
+            album = next((row[c].strip() for c in album_cols if row[c]), None)
+
+            if artist:
+                # Use one spelling per artist so variants share a search batch
+                canonical_artist = canonicalize_name(artist)
+                artist = artist_spellings.setdefault(canonical_artist, artist)
 
             if artist and title:
                 # Create a unique key to avoid duplicates
-                key = f"{artist} - {title}"
-                if key not in [f"{t['artist']} - {t['title']}" for t in tracks]:
+                key = (canonical_artist, canonicalize_name(title))
+                if key not in seen_tracks:
+                    seen_tracks.add(key)
                     tracks.append({
                         'artist': artist,
                         'title': title,
@@ -960,7 +1472,8 @@ def parse_spotify_csv(file_path: Path) -> List[Dict]:
                     })
             elif artist:
                 # Fallback if only artist is found
-                if artist not in [t['artist'] for t in tracks if not t.get('title')]:
+                if canonical_artist not in seen_artists:
+                    seen_artists.add(canonical_artist)
                     tracks.append({
                         'artist': artist,
                         'title': '',
@@ -975,6 +1488,43 @@ def parse_spotify_csv(file_path: Path) -> List[Dict]:
         raise
 
 
+def file_extension(filename: str) -> str:
+    """Lowercase extension without the dot, read straight off the Slskd filename string"""
+    _, dot, extension = filename.rpartition('.')
+    return extension.lower() if dot else ''
+
+
+def wait_for_search_files(client: SlskdClient, search_id: str, max_wait: float) -> Optional[List[Dict]]:
+    """
+    Poll a search until Slskd reports it complete, the file count stops
+    growing, or max_wait seconds pass. Returns the files found, or None if
+    the search was cancelled while waiting.
+    """
+    deadline = time.monotonic() + max_wait
+    delay = 0.25
+    last_count = -1
+
+    while True:
+        if search_cancelled.wait(min(delay, max(deadline - time.monotonic(), 0))):
+            return None
+
+        response = client.get_search_results(search_id)
+        files = response.get('files', [])
+
+        if response.get('isComplete'):
+            break
+        # Once polls are a second apart, an unchanged non-empty count means results have settled
+        if files and len(files) == last_count and delay >= 1:
+            break
+        if time.monotonic() >= deadline:
+            break
+
+        last_count = len(files)
+        delay = min(delay * 1.5, 2.0)
+
+    return files
+
+
 def search_artist_batch(client: SlskdClient, artist: str, tracks: List[Dict]) -> Tuple[Dict[str, List[Dict]], List[Dict]]:
     """
     Perform a batch search for an artist and match against multiple tracks.
@@ -989,35 +1539,38 @@ def search_artist_batch(client: SlskdClient, artist: str, tracks: List[Dict]) ->
     """
     logger.info(f"[BATCH] Starting batch search for artist: {artist} ({len(tracks)} tracks)")
     
-    # 1. Search for Artist
-    try:
-        search_response = client.search(artist)
-        search_id = search_response.get('id')
-        
-        if not search_id:
-            logger.error(f"[BATCH] No search ID for artist: {artist}")
-            return {}, tracks
+    # 1. Search for Artist (reusing recent results for the same artist)
+    files = search_cache.get(artist)
+    if files is not None:
+        logger.info(f"[BATCH] Using {len(files)} cached files for artist: {artist}")
+    else:
+        try:
+            search_response = client.search(artist, timeout=CONFIG.get('SEARCH_TIMEOUT', 15))
+            search_id = search_response.get('id')
+
+            if not search_id:
+                logger.error(f"[BATCH] No search ID for artist: {artist}")
+                return {}, tracks
+
+            # Poll for results (up to SEARCH_TIMEOUT, usually much less)
+            logger.info(f"[BATCH] Waiting for artist results: {artist}")
+            files = wait_for_search_files(client, search_id, max_wait=CONFIG.get('SEARCH_TIMEOUT', 15))
+            if files is None:
+                logger.info(f"[BATCH] Search cancelled while waiting for: {artist}")
+                return {}, []
+            logger.info(f"[BATCH] Retrieved {len(files)} files for artist: {artist}")
+            search_cache.put(artist, files)
 
-        # Wait for results
-        wait_time = 8
-        logger.info(f"[BATCH] Waiting {wait_time}s for artist results: {artist}")
-        time.sleep(wait_time)
-        
-        # Fetch results
-        results_response = client.get_search_results(search_id)
-        files = results_response.get('files', [])
-        logger.info(f"[BATCH] Retrieved {len(files)} files for artist: {artist}")
-        
-    except Exception as e:
-        logger.error(f"[BATCH] Error searching for artist {artist}: {e}")
-        return {}, tracks
+        except Exception as e:
+            logger.error(f"[BATCH] Error searching for artist {artist}: {e}")
+            return {}, tracks
 
     # 2. Match files to tracks
     found_results = {}
     failed_tracks = []
     
-    # Pre-process files for faster matching (optional optimization)
-    # For now, we iterate.
+    # Lowercase every filename once per batch rather than once per track
+    lowered_filenames = [file_info.get('filename', '').lower() for file_info in files]
     
     for track in tracks:
         title = track.get('title', '')
@@ -1025,41 +1578,17 @@ def search_artist_batch(client: SlskdClient, artist: str, tracks: List[Dict]) ->
         
         if not title:
             continue
+        title_lower = title.lower()
             
         # Filter files for this track
         track_matches = []
-        for file_info in files:
-            filename = file_info.get('filename', '')
-            
+        for file_info, filename_lower in zip(files, lowered_filenames):
             # Simple fuzzy match: filename must contain title (case-insensitive)
             # This is a loose check, we rely on calculate_quality_score for strictness later
-            if title.lower() in filename.lower():
-                 try:
-                    # Extract file information (reuse logic from search_single_item)
-                    size = file_info.get('size', 0)
-                    username = file_info.get('username', 'Unknown')
-                    extension = Path(filename).suffix.lower().replace('.', '')
-                    bitrate = file_info.get('bitRate', 0)
-                    queue_length = file_info.get('queueLength', 0)
-                    upload_speed = file_info.get('uploadSpeed', 0)
-                    speed_kbs = upload_speed / 1024 if upload_speed else 0
-                    has_free_slot = file_info.get('hasFreeUploadSlot', False)
-                    is_locked = file_info.get('isLocked', False)
-
-                    result_dict = {
-                        'username': username,
-                        'filename': filename,
-                        'size': size,
-                        'bitrate': bitrate,
-                        'extension': extension,
-                        'queue_length': queue_length,
-                        'speed_kbs': speed_kbs,
-                        'has_free_slot': has_free_slot,
-                        'is_locked': is_locked,
-                        'requested_title': title
-                    }
-                    track_matches.append(result_dict)
-                 except Exception:
+            if title_lower in filename_lower:
+                try:
+                    track_matches.append(FileResult.from_slskd(file_info, title))
+                except Exception:
                     continue
 
         # Apply quality filters
@@ -1089,66 +1618,37 @@ def search_single_item(client: SlskdClient, search_item: Dict) -> Tuple[List[Dic
         display_name = artist
 
     try:
-        logger.info(f"Searching for: {query}")
-
-        # Perform search
-        # Note: client.search returns a dict, we need the ID
-        search_response = client.search(query)
-        search_id = search_response.get('id')
-        
-        if not search_id:
-            logger.error(f"No search ID returned for {query}")
-            return [], ""
-
-        # Wait for results to accumulate
-        # HARDCODED WAIT: Give Slskd time to find files before querying
-        wait_time = 5  # seconds
-        logger.info(f"[SEARCH_WAIT] Starting {wait_time}s wait for search ID: {search_id}")
-        print(f"DEBUG: About to sleep for {wait_time} seconds for search: {query}")
-        time.sleep(wait_time)
-        print(f"DEBUG: Finished sleeping, now fetching results for search: {query}")
-        logger.info(f"[SEARCH_WAIT] Finished {wait_time}s wait, now fetching results for: {query}") 
-
-        # Fetch results
-        logger.info(f"[SEARCH_FETCH] Fetching results for search ID: {search_id}")
-        results_response = client.get_search_results(search_id)
-        files = results_response.get('files', [])
-        logger.info(f"[SEARCH_FETCH] Retrieved {len(files)} raw files from Slskd for: {query}")
-        print(f"DEBUG: Got {len(files)} files from Slskd for search: {query}")
+        files = search_cache.get(query)
+        search_id = ""
+        if files is not None:
+            logger.info(f"[SEARCH_CACHE] Using {len(files)} cached files for: {query}")
+        else:
+            logger.info(f"Searching for: {query}")
+
+            # Perform search
+            # Note: client.search returns a dict, we need the ID
+            search_response = client.search(query, timeout=CONFIG.get('SEARCH_TIMEOUT', 15))
+            search_id = search_response.get('id')
+
+            if not search_id:
+                logger.error(f"No search ID returned for {query}")
+                return [], ""
+
+            # Poll for results to accumulate (up to SEARCH_TIMEOUT, usually much less)
+            logger.info(f"[SEARCH_WAIT] Polling results for search ID: {search_id}")
+            files = wait_for_search_files(client, search_id, max_wait=CONFIG.get('SEARCH_TIMEOUT', 15))
+            if files is None:
+                logger.info(f"[SEARCH_WAIT] Search cancelled while waiting for: {query}")
+                return [], ""
+            logger.info(f"[SEARCH_FETCH] Retrieved {len(files)} raw files from Slskd for: {query}")
+            search_cache.put(query, files)
 
         # Parse and format results
         all_results = []
         for file_info in files:
             try:
-                # Extract file information
-                filename = file_info.get('filename', '')
-                size = file_info.get('size', 0)
-                username = file_info.get('username', 'Unknown')
-
-                # Quality metrics
-                extension = Path(filename).suffix.lower().replace('.', '')
-                bitrate = file_info.get('bitRate', 0)
-                queue_length = file_info.get('queueLength', 0)
-                upload_speed = file_info.get('uploadSpeed', 0)
-                speed_kbs = upload_speed / 1024 if upload_speed else 0
-                has_free_slot = file_info.get('hasFreeUploadSlot', False)
-                is_locked = file_info.get('isLocked', False)
-
-                result_dict = {
-                    'username': username,
-                    'filename': filename,
-                    'size': size,
-                    'bitrate': bitrate,
-                    'extension': extension,
-                    'queue_length': queue_length,
-                    'speed_kbs': speed_kbs,
-                    'has_free_slot': has_free_slot,
-                    'is_locked': is_locked,
-                    'requested_title': title # Pass for fuzzy matching
-                }
-                
-                all_results.append(result_dict)
-            except Exception as e:
+                all_results.append(FileResult.from_slskd(file_info, title))
+            except Exception:
                 continue
 
         # Apply smart quality filtering and ranking
@@ -1179,6 +1679,7 @@ def background_search_task(search_items: List[Dict] = None):
 
     # Initialize search state
     search_state['active'] = True
+    search_cancelled.clear()
     search_state['total'] = queue_manager.get_count() + search_state.get('progress', 0)
     if not search_state.get('progress'):
         search_state['progress'] = 0
@@ -1188,11 +1689,7 @@ def background_search_task(search_items: List[Dict] = None):
 
     # Initialize Slskd client
     try:
-        client = SlskdClient(
-            host=CONFIG['SLSKD_URL'],
-            api_key=CONFIG['SLSKD_API_KEY'],
-            url_base=CONFIG['SLSKD_URL_BASE']
-        )
+        client = get_slskd_client()
     except Exception as e:
         logger.error(f"Failed to initialize Slskd client: {e}")
         search_state['errors'].append(f"Failed to connect to Slskd: {e}")
@@ -1201,33 +1698,56 @@ def background_search_task(search_items: List[Dict] = None):
         save_application_state(search_state)
         return
 
-    def process_artist_group(artist: str, tracks: List[Dict]):
-        """Process all tracks for a single artist"""
-        if not search_state['active']:
-            return
+    # /search/status reads search_state from memory, so progress only needs to
+    # reach disk occasionally; the final save below records the exact count
+    last_state_save = 0.0
+
+    def record_progress():
+        nonlocal last_state_save
+        with state_lock:
+            search_state['progress'] += 1
+            now = time.monotonic()
+            if now - last_state_save >= STATE_SAVE_INTERVAL:
+                last_state_save = now
+                save_application_state(search_state)
+
+    def process_artist_group(artist: str, tracks: List[Dict]) -> Tuple[str, List[Dict]]:
+        """Process all tracks for a single artist, returning the tracks the batch missed"""
+        if search_cancelled.is_set():
+            return artist, []
 
         logger.info(f"[WORKER] Processing batch for artist: {artist} ({len(tracks)} tracks)")
-        search_state['current_item'] = f"Batch: {artist}"
-        save_application_state(search_state)
+        with state_lock:
+            search_state['current_item'] = f"Batch: {artist}"
+            save_application_state(search_state)
 
-        # 1. Enrich metadata for all tracks (MusicBrainz)
-        for track in tracks:
-            title = track.get('title', '')
-            if title:
-                try:
-                    mb_metadata = musicbrainz_client.get_track_metadata(artist, title)
-                    if mb_metadata:
-                        track['musicbrainz_metadata'] = mb_metadata
-                except Exception:
-                    pass
+        # 1. Enrich metadata for all tracks (MusicBrainz). This is rate limited to
+        # about one lookup a second and the batch search doesn't need it, so run
+        # it alongside the search instead of before it
+        def enrich_tracks():
+            for track in tracks:
+                if search_cancelled.is_set():
+                    return
+                title = track.get('title', '')
+                if title:
+                    try:
+                        mb_metadata = musicbrainz_client.get_track_metadata(artist, title)
+                        if mb_metadata:
+                            track['musicbrainz_metadata'] = mb_metadata
+                    except Exception:
+                        pass
+
+        enricher = threading.Thread(target=enrich_tracks, daemon=True)
+        enricher.start()
 
         # 2. Batch Search
         found_results, failed_tracks = search_artist_batch(client, artist, tracks)
+        enricher.join()
 
-        # 3. Save Found Results
+        # 3. Save Found Results, looking each track up by the key search_artist_batch used
+        tracks_by_key = {f"{artist} - {t.get('title')}": t for t in reversed(tracks)}
         for track_key, results in found_results.items():
-            # Find original track data to save
-            original_track = next((t for t in tracks if f"{artist} - {t.get('title')}" == track_key), None)
+            original_track = tracks_by_key.get(track_key)
             if original_track:
                 # Construct result object
                 search_result = {
@@ -1242,49 +1762,45 @@ def background_search_task(search_items: List[Dict] = None):
                     'key': track_key
                 }
                 search_manager.add_result(search_result)
-                search_state['progress'] += 1
-                save_application_state(search_state)
+                record_progress()
 
-        # 4. Retry Failed Tracks (Fallback to Single Search)
-        for track in failed_tracks:
-            if not search_state['active']: break
-            
-            logger.info(f"[FALLBACK] Batch failed for {track.get('title')}, trying specific search")
-            results, search_id = search_single_item(client, track)
-            
-            # Save result (even if empty, to mark as searched)
-            track_key = f"{artist} - {track.get('title')}"
-            search_result = {
-                'artist': artist,
-                'title': track.get('title'),
-                'album': track.get('album', ''),
-                'results': results,
-                'result_count': len(results),
-                'musicbrainz': track.get('musicbrainz_metadata'),
-                'last_updated': datetime.now().isoformat(),
-                'reviewed': False,
-                'key': track_key
-            }
-            search_manager.add_result(search_result)
-            search_state['progress'] += 1
-            save_application_state(search_state)
+        return artist, failed_tracks
+
+    def process_fallback(artist: str, track: Dict):
+        """Retry a track the batch search missed with a specific search"""
+        if search_cancelled.is_set():
+            return
+
+        logger.info(f"[FALLBACK] Batch failed for {track.get('title')}, trying specific search")
+        results, search_id = search_single_item(client, track)
+        if search_cancelled.is_set():
+            # Don't record an interrupted search as "no results"
+            return
+
+        # Save result (even if empty, to mark as searched)
+        track_key = f"{artist} - {track.get('title')}"
+        search_result = {
+            'artist': artist,
+            'title': track.get('title'),
+            'album': track.get('album', ''),
+            'results': results,
+            'result_count': len(results),
+            'musicbrainz': track.get('musicbrainz_metadata'),
+            'last_updated': datetime.now().isoformat(),
+            'reviewed': False,
+            'key': track_key
+        }
+        search_manager.add_result(search_result)
+        record_progress()
 
     try:
         # Drain queue and group by artist
-        all_items = []
-        while True:
-            item = queue_manager.get_next()
-            if not item:
-                break
-            all_items.append(item)
+        all_items = queue_manager.drain()
 
         # Group by artist
         items_by_artist = {}
         for item in all_items:
-            artist = item.get('artist', 'Unknown')
-            if artist not in items_by_artist:
-                items_by_artist[artist] = []
-            items_by_artist[artist].append(item)
+            items_by_artist.setdefault(item.get('artist', 'Unknown'), []).append(item)
 
         logger.info(f"Grouped {len(all_items)} tracks into {len(items_by_artist)} artist batches")
 
@@ -1293,16 +1809,37 @@ def background_search_task(search_items: List[Dict] = None):
             search_state['total'] = len(all_items) + search_state.get('progress', 0)
             save_application_state(search_state)
 
-            # Process artists in parallel
-            max_workers = 4 
+            # Process artists in parallel, capped so Slskd isn't flooded
+            max_workers = max(1, CONFIG.get('SEARCH_CONCURRENCY', 4))
             with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = []
+                batch_futures = []
                 for artist, tracks in items_by_artist.items():
-                    if not search_state['active']: break
-                    futures.append(executor.submit(process_artist_group, artist, tracks))
-                
+                    if search_cancelled.is_set(): break
+                    batch_futures.append(executor.submit(process_artist_group, artist, tracks))
+
+                # 4. Retry failed tracks on the same pool as soon as their batch finishes,
+                # rather than one after another inside the batch worker
+                fallback_futures = []
+                for future in concurrent.futures.as_completed(batch_futures):
+                    try:
+                        artist, failed_tracks = future.result()
+                    except Exception as e:
+                        logger.error(f"[WORKER] Batch error: {e}")
+                        with state_lock:
+                            search_state['errors'].append(str(e))
+                        continue
+                    for track in failed_tracks:
+                        if search_cancelled.is_set(): break
+                        fallback_futures.append(executor.submit(process_fallback, artist, track))
+
                 # Wait for completion
-                concurrent.futures.wait(futures)
+                for future in concurrent.futures.as_completed(fallback_futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"[FALLBACK] Search error: {e}")
+                        with state_lock:
+                            search_state['errors'].append(str(e))
 
     except Exception as e:
         logger.error(f"Background search task error: {e}")
@@ -1311,6 +1848,8 @@ def background_search_task(search_items: List[Dict] = None):
         search_state['active'] = False
         search_state['completed'] = True
         save_application_state(search_state)
+        # Persist the final batch now rather than waiting for the debounce
+        search_manager.flush()
         logger.info("Background search task finished")
 
 
@@ -1325,13 +1864,16 @@ def index():
 
     stats = search_manager.get_stats()
 
-    # Get results grouped by artist for the new UI
-    artist_results = search_manager.get_results_by_artist()
-    
-    # Sort artists by name
-    sorted_artists = dict(sorted(artist_results.items()))
+    # Get one page of results grouped by artist and sorted by name
+    per_page = max(1, request.args.get('per_page', CONFIG.get('ARTISTS_PER_PAGE', 50), type=int))
+    page = max(1, request.args.get('page', 1, type=int))
+    sorted_artists, total_artists = search_manager.get_artist_page(page, per_page)
+    total_pages = max(1, -(-total_artists // per_page))
+    if page > total_pages:
+        return redirect(url_for('index', page=total_pages, per_page=per_page))
 
-    return render_template('index.html', stats=stats, artists=sorted_artists, search_state=search_state, slskd_url=CONFIG['SLSKD_URL'])
+    return render_template('index.html', stats=stats, artists=sorted_artists, search_state=search_state,
+                           slskd_url=CONFIG['SLSKD_URL'], page=page, per_page=per_page, total_pages=total_pages)
 
 
 @app.route('/settings', methods=['GET', 'POST'])
@@ -1360,6 +1902,7 @@ def settings():
         # Save configuration
         if save_config(new_config):
             CONFIG.update(new_config)
+            watchlist_wake.set()  # Re-check the watchlist with the new settings now
             return jsonify({'success': True, 'message': 'Configuration saved successfully'})
         else:
             return jsonify({'error': 'Failed to save configuration'}), 500
@@ -1424,6 +1967,10 @@ def delete_track(track_key):
         success = search_manager.delete_track(track_key)
         
         if research and artist:
+            # A re-search should hit Slskd again rather than reuse cached files
+            search_cache.invalidate(artist)
+            search_cache.invalidate(f"{artist} {title}" if title else artist)
+
             # Add back to queue
             queue_manager.add_items([{
                 'artist': artist,
@@ -1462,27 +2009,16 @@ def download_specific():
         if not username or not filename:
             return jsonify({'error': 'Missing username or filename'}), 400
 
-        # Check for duplicates via ISRC if track_key provided
+        # Look up the ISRC so the download is recorded against it. Duplicates aren't
+        # blocked here: the UI disables the button, and an explicit request is honoured
         isrc = None
         if track_key:
             track_data = search_manager.get_track_results(track_key)
-            if track_data and 'musicbrainz' in track_data:
+            if track_data and track_data.get('musicbrainz'):
                 isrc = track_data['musicbrainz'].get('isrc')
-                if isrc and isrc_tracker.is_duplicate(isrc):
-                    # We allow override if user explicitly clicked download on a specific file?
-                    # Maybe just warn? But the UI disables the button if duplicate.
-                    # If they bypass, let them download.
-                    pass
-
-        # Initiate download
-        # We need a client instance. Since we are in a route, we can create one or use a global one if thread-safe.
-        # SlskdClient creates a session. It's better to create a new one or use a pool.
-        # For simplicity, create new one.
-        client = SlskdClient(
-            host=CONFIG['SLSKD_URL'],
-            api_key=CONFIG['SLSKD_API_KEY'],
-            url_base=CONFIG['SLSKD_URL_BASE']
-        )
+
+        # Initiate download using the shared client (its session keeps connections alive)
+        client = get_slskd_client()
         
         result = client.download_file(username, filename)
         
@@ -1531,12 +2067,8 @@ def start_search():
         
         if not force:
             # Check if "Artist - Title" exists in results
-            filtered_artists = []
-            for a in artists:
-                key = f"{a.get('artist', '')} - {a.get('title', '')}" if a.get('title') else a.get('artist', '')
-                if not search_manager.get_track_results(key):
-                    filtered_artists.append(a)
-            artists = filtered_artists
+            existing_keys = search_manager.get_track_keys()
+            artists = [a for a in artists if make_track_key(a) not in existing_keys]
 
         if not artists:
             return jsonify({'message': 'All items already searched', 'count': 0}), 200
@@ -1547,7 +2079,7 @@ def start_search():
             artist = item.get('artist', '')
             title = item.get('title', '')
             album = item.get('album', '')
-            key = f"{artist} - {title}" if title else artist
+            key = make_track_key(item)
             
             # Create a placeholder result
             pending_result = {
@@ -1590,6 +2122,7 @@ def search_status():
 def cancel_search():
     """Cancel ongoing search"""
     global search_state
+    search_cancelled.set()
     search_state['active'] = False
     return jsonify({'success': True})
 
@@ -1610,54 +2143,58 @@ def get_stats():
 
 @app.route('/export/csv')
 def export_csv():
-    """Export all results to CSV"""
+    """Export all results to CSV, streamed one track at a time"""
     try:
-        output = StringIO()
-        writer = csv.writer(output)
+        # Snapshot the track list so the stream isn't affected by concurrent writes
+        with search_manager.lock:
+            tracks = list(search_manager.results.get('tracks', {}).values())
+
+        def generate():
+            buffer = StringIO()
+            writer = csv.writer(buffer)
+
+            # Write header
+            writer.writerow(['Artist', 'Title', 'Album', 'Username', 'Filename', 'Size (MB)', 'Bitrate', 'Extension',
+                            'Queue', 'Speed (KB/s)', 'Quality Score', 'Reviewed'])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+            # Write data
+            for track_data in tracks:
+                reviewed = 'Yes' if track_data.get('reviewed', False) else 'No'
+                artist = track_data.get('artist', '')
+                title = track_data.get('title', '')
+                album = track_data.get('album', '')
+                writer.writerows(
+                    (
+                        artist,
+                        title,
+                        album,
+                        result.username,
+                        result.filename,
+                        result.size_mb,
+                        result.bitrate,
+                        result.extension,
+                        result.queue_length,
+                        round(result.speed_kbs, 2),
+                        round(result.quality_score, 2),
+                        reviewed
+                    )
+                    for result in track_data['results']
+                )
 
-        # Write header
-        writer.writerow(['Artist', 'Title', 'Album', 'Username', 'Filename', 'Size (MB)', 'Bitrate', 'Extension',
-                        'Queue', 'Speed (KB/s)', 'Quality Score', 'Reviewed'])
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
 
-        # Write data
-        tracks = search_manager.results.get('tracks', {})
-        for track_key, track_data in tracks.items():
-            reviewed = 'Yes' if track_data.get('reviewed', False) else 'No'
-            artist = track_data.get('artist', '')
-            title = track_data.get('title', '')
-            album = track_data.get('album', '')
-            for result in track_data['results']:
-                writer.writerow([
-                    artist,
-                    title,
-                    album,
-                    result['username'],
-                    result['filename'],
-                    round(result['size'] / (1024 * 1024), 2),  # Convert to MB
-                    result['bitrate'],
-                    result['extension'],
-                    result.get('queue_length', 'N/A'),
-                    round(result.get('speed_kbs', 0), 2),
-                    round(result.get('quality_score', 0), 2),
-                    reviewed
-                ])
-
-        # Create response
-        output.seek(0)
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f'slskd_search_results_{timestamp}.csv'
-        
-        # Convert to bytes
-        from io import BytesIO
-        mem = BytesIO()
-        mem.write(output.getvalue().encode('utf-8'))
-        mem.seek(0)
-
-        return send_file(
-            mem,
+
+        return Response(
+            generate(),
             mimetype='text/csv',
-            as_attachment=True,
-            download_name=filename
+            headers={'Content-Disposition': f'attachment; filename={filename}'}
         )
 
     except Exception as e:
@@ -1690,18 +2227,14 @@ def download_track(track_key: str):
 
         # Get top result
         top_result = track_data['results'][0]
-        username = top_result.get('username')
-        filename = top_result.get('filename')
+        username = top_result.username
+        filename = top_result.filename
 
         if not username or not filename:
             return jsonify({'error': 'Invalid result data'}), 400
 
         # Initialize Slskd client
-        client = SlskdClient(
-            host=CONFIG['SLSKD_URL'],
-            api_key=CONFIG['SLSKD_API_KEY'],
-            url_base=CONFIG['SLSKD_URL_BASE']
-        )
+        client = get_slskd_client()
 
         # Initiate download via Slskd API
         logger.info(f"[DOWNLOAD_ROUTE] Attempting download for {track_key}")
@@ -1717,8 +2250,8 @@ def download_track(track_key: str):
                 filename=filename,
                 album=track_data.get('album'),
                 username=username,
-                size=top_result.get('size'),
-                bitrate=top_result.get('bitrate'),
+                size=top_result.size,
+                bitrate=top_result.bitrate,
                 musicbrainz_id=musicbrainz_data.get('musicbrainz_id') if musicbrainz_data else None
             )
 
@@ -1758,11 +2291,7 @@ def bulk_download():
             return jsonify({'error': 'No tracks provided'}), 400
 
         # Initialize Slskd client
-        client = SlskdClient(
-            host=CONFIG['SLSKD_URL'],
-            api_key=CONFIG['SLSKD_API_KEY'],
-            url_base=CONFIG['SLSKD_URL_BASE']
-        )
+        client = get_slskd_client()
 
         downloaded = 0
         failed = 0
@@ -1795,8 +2324,8 @@ def bulk_download():
 
                 # Get top result
                 top_result = track_data['results'][0]
-                username = top_result.get('username')
-                filename = top_result.get('filename')
+                username = top_result.username
+                filename = top_result.filename
 
                 if not username or not filename:
                     failed += 1
@@ -1818,8 +2347,8 @@ def bulk_download():
                         album=track_data.get('album'),
                         username=username,
                         filename=filename,
-                        size=top_result.get('size'),
-                        bitrate=top_result.get('bitrate'),
+                        size=top_result.size,
+                        bitrate=top_result.bitrate,
                         musicbrainz_id=musicbrainz_data.get('musicbrainz_id') if musicbrainz_data else None
                     )
                 else:
@@ -1847,10 +2376,26 @@ def bulk_download():
 
 @app.route('/backup/download')
 def download_backup():
-    """Download the search_results.json file"""
-    if RESULTS_FILE.exists():
-        return send_file(RESULTS_FILE, as_attachment=True, download_name='search_results_backup.json')
-    return jsonify({'error': 'No results file found'}), 404
+    """Download a JSON backup of all search results"""
+    from io import BytesIO
+    with search_manager.lock:
+        payload = orjson.dumps(search_manager.results, option=orjson.OPT_INDENT_2)
+
+    # Indented JSON compresses well; browsers decode this transparently and still save plain JSON
+    gzipped = 'gzip' in request.headers.get('Accept-Encoding', '')
+    if gzipped:
+        payload = gzip.compress(payload, compresslevel=1)
+
+    response = send_file(
+        BytesIO(payload),
+        mimetype='application/json',
+        as_attachment=True,
+        download_name='search_results_backup.json'
+    )
+    response.headers['Vary'] = 'Accept-Encoding'
+    if gzipped:
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
 
 
 @app.route('/health')
@@ -1859,14 +2404,14 @@ def health_check():
     try:
         # Test Slskd connection if configured
         if CONFIG.get('SLSKD_API_KEY'):
-            client = SlskdClient(
-                host=CONFIG['SLSKD_URL'],
-                api_key=CONFIG['SLSKD_API_KEY'],
-                url_base=CONFIG['SLSKD_URL_BASE']
-            )
+            client = get_slskd_client()
 
-            # Try to get server state
-            state = client.application_state()
+            # Try to get server state, giving up quickly if Slskd is unresponsive
+            future = slskd_executor.submit(client.application_state)
+            try:
+                state = future.result(timeout=HEALTH_CHECK_TIMEOUT)
+            except concurrent.futures.TimeoutError:
+                raise TimeoutError(f"Slskd did not respond within {HEALTH_CHECK_TIMEOUT}s")
 
             return jsonify({
                 'status': 'healthy',
@@ -1894,24 +2439,24 @@ def watchlist_monitor():
     while True:
         try:
             if CONFIG.get('SLSKD_API_KEY'):
-                client = SlskdClient(
-                    host=CONFIG['SLSKD_URL'],
-                    api_key=CONFIG['SLSKD_API_KEY'],
-                    url_base=CONFIG['SLSKD_URL_BASE']
-                )
+                client = get_slskd_client()
                 watchlist_manager.check_watchlist(client)
         except Exception as e:
             logger.error(f"Watchlist monitor error: {e}")
-        
-        time.sleep(300) # Check every 5 minutes
+
+        # Sleep until the next check, waking early if settings change; the
+        # interval is re-read each time and jittered so checks don't line up
+        interval = max(CONFIG.get('WATCHLIST_INTERVAL', 300), 1)
+        watchlist_wake.wait(interval * random.uniform(0.9, 1.1))
+        watchlist_wake.clear()
 
 # Start monitor thread
 monitor_thread = threading.Thread(target=watchlist_monitor, daemon=True)
 monitor_thread.start()
 
 
-if __name__ == '__main__':
-    # Log startup info
+def log_startup_info():
+    """Log the effective configuration once at startup"""
     logger.info("=" * 50)
     logger.info("Spotify to Slskd Search Aggregator with Smart Quality")
     logger.info("=" * 50)
@@ -1919,6 +2464,7 @@ if __name__ == '__main__':
     logger.info(f"Data directory: {CONFIG['DATA_DIR']}")
     logger.info(f"Search timeout: {CONFIG['SEARCH_TIMEOUT']}s")
     logger.info(f"Search delay: {CONFIG['SEARCH_DELAY']}s")
+    logger.info(f"Search concurrency: {CONFIG['SEARCH_CONCURRENCY']}")
     logger.info(f"Min bitrate: {CONFIG['MIN_BITRATE']} kbps")
     logger.info(f"Max queue: {CONFIG['MAX_QUEUE_LENGTH']}")
     logger.info(f"Min speed: {CONFIG['MIN_SPEED_KBS']} KB/s")
@@ -1928,5 +2474,11 @@ if __name__ == '__main__':
     if not CONFIG.get('SLSKD_API_KEY'):
         logger.warning("SLSKD_API_KEY not configured! Please configure via web interface.")
 
-    # Run Flask app
-    app.run(host='0.0.0.0', port=5000, debug=False)
+
+# Under gunicorn (the production entrypoint) this module is imported, not run
+log_startup_info()
+
+
+if __name__ == '__main__':
+    # Run Flask development server
+    app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
@@ -1,10 +1,12 @@
-import json
 import logging
+import os
 import threading
 from pathlib import Path
 from typing import Optional, Dict
 import time
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 class ISRCTracker:
@@ -21,8 +23,8 @@ class ISRCTracker:
         """Load download history from JSON file."""
         if self.file_path.exists():
             try:
-                with open(self.file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.file_path, 'rb') as f:
+                    return orjson.loads(f.read())
             except Exception as e:
                 logger.error(f"Error loading downloads history: {e}")
                 return {}
@@ -33,8 +35,11 @@ class ISRCTracker:
         try:
             # Ensure directory exists
             self.file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.history, f, indent=2, ensure_ascii=False)
+            # Write a temp file and swap it in so a crash can't truncate the history
+            tmp_path = self.file_path.with_name(self.file_path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(self.history))
+            os.replace(tmp_path, self.file_path)
         except Exception as e:
             logger.error(f"Error saving downloads history: {e}")
 
@@ -1,4 +1,5 @@
 import logging
+import threading
 import time
 import requests
 from typing import Optional, Dict
@@ -24,15 +25,18 @@ class MusicBrainzClient:
         self.last_request_time = 0
         # MusicBrainz rate limit rule: 1 request per second per IP
         self.rate_limit_delay = 1.1
+        # Search workers share this client, so callers take turns through the limiter
+        self.rate_limit_lock = threading.Lock()
 
     def _rate_limit(self):
         """Ensure we adhere to the MusicBrainz API rate limit."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        if time_since_last_request < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last_request
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+        with self.rate_limit_lock:
+            current_time = time.time()
+            time_since_last_request = current_time - self.last_request_time
+            if time_since_last_request < self.rate_limit_delay:
+                sleep_time = self.rate_limit_delay - time_since_last_request
+                time.sleep(sleep_time)
+            self.last_request_time = time.time()
 
     def get_track_metadata(self, artist: str, title: str) -> Optional[Dict]:
         """
@@ -120,7 +120,7 @@ User=root
 WorkingDirectory=/opt/slskd-spotify-self-host
 Environment=\"PATH=/usr/bin\"
 EnvironmentFile=/opt/slskd-spotify-self-host/.env
-ExecStart=/usr/bin/python3 /opt/slskd-spotify-self-host/app.py
+ExecStart=/usr/bin/python3 -m gunicorn --bind 0.0.0.0:5000 --workers 1 --threads 8 --timeout 120 app:app
 Restart=always
 RestartSec=10
 StandardOutput=journal